@@ -3,6 +3,7 @@ from urllib.parse import urljoin
 import requests
 import logging
 from typing import Optional
+from api.cassette import Cassette
 
 logger = logging.getLogger(__name__)
 
@@ -12,10 +13,13 @@ class BaseAPIClient:
     Usage:
       client = BaseAPIClient("https://api.vineetkr.com")
       resp = client.get("/api/users")
+    Pass a Cassette to record live traffic or replay it offline.
     """
-    def __init__(self, base_url: str, session: Optional[requests.Session] = None):
+    def __init__(self, base_url: str, session: Optional[requests.Session] = None,
+                 cassette: Optional[Cassette] = None):
         self.base_url = base_url.rstrip('/') + '/'
         self.session = session or requests.Session()
+        self.cassette = cassette
 
     def _build_url(self, path: str) -> str:
         return urljoin(self.base_url, path.lstrip('/'))
@@ -24,10 +28,17 @@ class BaseAPIClient:
                 json: Optional[dict] = None, data: Optional[dict] = None,
                 headers: Optional[dict] = None, **kwargs) -> requests.Response:
         url = self._build_url(path)
+        if self.cassette is not None and not self.cassette.recording:
+            if params:
+                url = requests.Request(method.upper(), url, params=params).prepare().url
+            return self.cassette.replay(method, url)
         logger.info("%s %s", method.upper(), url)
-        return self.session.request(method=method.upper(), url=url,
-                                    params=params, json=json, data=data,
-                                    headers=headers or {}, **kwargs)
+        response = self.session.request(method=method.upper(), url=url,
+                                        params=params, json=json, data=data,
+                                        headers=headers or {}, **kwargs)
+        if self.cassette is not None:
+            self.cassette.record(response, json_body=json)
+        return response
 
     def get(self, path: str, **kwargs) -> requests.Response:
         return self.request("GET", path, **kwargs)
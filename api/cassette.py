@@ -0,0 +1,118 @@
+import json
+import logging
+from collections import defaultdict
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when no recorded interaction matches a request."""
+
+
+class Cassette:
+    """
+    Recorded request/response pairs stored as JSON under data/cassettes/.
+    Interactions are matched on method + path + query; repeated requests are
+    replayed in the order they were recorded (request bodies are ignored so
+    timestamped payloads still match).
+    Usage:
+      cassette = Cassette(Config.DATA_DIR / "cassettes" / "users.json", mode="record")
+      client = BaseAPIClient("https://api.vineetkr.com", cassette=cassette)
+      ...
+      cassette.save()
+    """
+    MODES = ("record", "replay")
+
+    def __init__(self, path, mode: str = "replay"):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown cassette mode '{mode}', expected one of {self.MODES}")
+        self.path = Path(path)
+        self.mode = mode
+        self.interactions = []
+        self._cursor = defaultdict(int)
+        if mode == "replay":
+            self.interactions = self._read()
+        self._index = self._build_index()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @staticmethod
+    def _key(method: str, url: str) -> str:
+        parts = urlsplit(url)
+        query = f"?{parts.query}" if parts.query else ""
+        return f"{method.upper()} {parts.path}{query}"
+
+    def _read(self):
+        if not self.path.is_file():
+            raise FileNotFoundError(f"Cassette not found: {self.path} (record it first with api_mode=record)")
+        with self.path.open("r") as f:
+            return json.load(f).get("interactions", [])
+
+    def _build_index(self):
+        index = defaultdict(list)
+        for interaction in self.interactions:
+            req = interaction["request"]
+            index[self._key(req["method"], req["url"])].append(interaction)
+        return index
+
+    def record(self, response: requests.Response, json_body=None):
+        """Append a live response to the cassette"""
+        req = response.request
+        self.interactions.append({
+            "request": {
+                "method": req.method,
+                "url": req.url,
+                "json": json_body,
+            },
+            "response": {
+                "status_code": response.status_code,
+                "headers": dict(response.headers),
+                "body": response.text,
+            },
+        })
+        self._index[self._key(req.method, req.url)].append(self.interactions[-1])
+
+    def replay(self, method: str, url: str) -> requests.Response:
+        """Return the next recorded response for method + url"""
+        key = self._key(method, url)
+        candidates = self._index.get(key)
+        if not candidates:
+            raise CassetteMissError(f"No recorded interaction for {key} in {self.path}")
+        position = self._cursor[key]
+        # Keep returning the last recording once the sequence is exhausted
+        interaction = candidates[min(position, len(candidates) - 1)]
+        self._cursor[key] = position + 1
+        logger.info("REPLAY %s", key)
+        return self._to_response(method, url, interaction["response"])
+
+    @staticmethod
+    def _to_response(method: str, url: str, recorded: dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = recorded["status_code"]
+        response.headers = CaseInsensitiveDict(recorded.get("headers") or {})
+        # Body is stored decoded, so drop transport encodings that no longer apply
+        response.headers.pop("Content-Encoding", None)
+        response.headers.pop("Transfer-Encoding", None)
+        response._content = (recorded.get("body") or "").encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = url
+        response.request = requests.Request(method=method.upper(), url=url).prepare()
+        return response
+
+    def save(self, path: Optional[Path] = None):
+        """Write recorded interactions to disk (no-op in replay mode)"""
+        if not self.recording:
+            return
+        target = Path(path or self.path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with target.open("w") as f:
+            json.dump({"interactions": self.interactions}, f, indent=2)
+        logger.info("Saved %d interactions to %s", len(self.interactions), target)
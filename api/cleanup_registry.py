@@ -0,0 +1,80 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CleanupRegistry:
+    """
+    Tracks resources created during a run so they are deleted even when a
+    scenario fails before its own DELETE step.
+    Usage:
+      registry = CleanupRegistry()
+      registry.register(client, "/api/users/123", headers=auth_headers)
+      registry.discard("/api/users/123")        # deleted inline by the scenario
+      registry.flush(max_workers=8)             # DELETE everything still pending
+    """
+    MODES = ("scenario", "batch", "off")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = []
+
+    def __len__(self):
+        with self._lock:
+            return len(self._pending)
+
+    def register(self, client, path: str, headers: Optional[dict] = None):
+        """Queue a DELETE of path through client"""
+        cassette = getattr(client, "cassette", None)
+        if cassette is not None and not cassette.recording:
+            # Replayed responses never created anything on the server
+            return
+        with self._lock:
+            self._pending.append((client, path, dict(headers or {})))
+        logger.debug("Registered %s for cleanup", path)
+
+    def discard(self, path: str):
+        """Forget path once the scenario has deleted it itself"""
+        with self._lock:
+            self._pending = [entry for entry in self._pending if entry[1] != path]
+
+    @staticmethod
+    def _delete(entry):
+        """DELETE one entry; return True if it failed"""
+        client, path, headers = entry
+        try:
+            resp = client.delete(path, headers=headers)
+        except Exception as e:
+            logger.warning("Cleanup DELETE %s failed: %s", path, e)
+            return True
+        # 404 means the resource is already gone, which is what we want
+        if resp.status_code >= 300 and resp.status_code != 404:
+            logger.warning("Cleanup DELETE %s returned %s", path, resp.status_code)
+            return True
+        return False
+
+    def flush(self, max_workers: int = 1, requeue_failed: bool = False):
+        """
+        Delete all pending resources, concurrently when max_workers > 1.
+        Failed entries are put back in the queue when requeue_failed is set,
+        so a later flush retries them. Returns the paths that failed.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return []
+        logger.info("Cleaning up %d resource(s)", len(pending))
+        if max_workers <= 1 or len(pending) == 1:
+            results = [self._delete(entry) for entry in pending]
+        else:
+            # Clients share a pooled requests.Session, so workers reuse keep-alive connections
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+                results = list(pool.map(self._delete, pending))
+        failed = [entry for entry, entry_failed in zip(pending, results) if entry_failed]
+        if requeue_failed and failed:
+            with self._lock:
+                self._pending.extend(failed)
+        return [path for _, path, _ in failed]
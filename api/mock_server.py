@@ -0,0 +1,207 @@
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USERS = [
+    {"name": "Vineet Kr", "email": "vineet.kr@example.com", "age": 30},
+    {"name": "Test User", "email": "test.user@example.com", "age": 25},
+]
+
+
+class UserStore:
+    """Thread-safe in-memory store backing the /api/users endpoints."""
+
+    def __init__(self, users: Optional[list] = None):
+        self._lock = threading.Lock()
+        self._users = {}
+        for user in users or []:
+            self.create(user)
+
+    def list(self):
+        with self._lock:
+            return list(self._users.values())
+
+    def get(self, user_id):
+        with self._lock:
+            return self._users.get(user_id)
+
+    def create(self, data: dict):
+        user = dict(data)
+        user.setdefault("_id", uuid.uuid4().hex[:24])
+        with self._lock:
+            self._users[user["_id"]] = user
+        return user
+
+    def update(self, user_id, data: dict):
+        with self._lock:
+            if user_id not in self._users:
+                return None
+            self._users[user_id].update({k: v for k, v in data.items() if k != "_id"})
+            return self._users[user_id]
+
+    def delete(self, user_id):
+        with self._lock:
+            return self._users.pop(user_id, None)
+
+
+class _UsersHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; with Nagle on, keep-alive clients wait ~40ms for the delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        logger.debug("mock %s - %s", self.address_string(), format % args)
+
+    def _send(self, status: int, payload: dict):
+        self.server.apply_latency()
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return None
+
+    def _route(self):
+        """Return (matched, user_id) for /api/users and /api/users/<id>"""
+        parts = [p for p in self.path.split("?", 1)[0].split("/") if p]
+        if parts[:2] != ["api", "users"] or len(parts) > 3:
+            return False, None
+        return True, parts[2] if len(parts) == 3 else None
+
+    def _not_found(self):
+        self._send(404, {"success": False, "message": "Not found"})
+
+    def do_GET(self):
+        matched, user_id = self._route()
+        if not matched:
+            return self._not_found()
+        store = self.server.store
+        if user_id is None:
+            return self._send(200, {"success": True, "data": store.list()})
+        user = store.get(user_id)
+        if user is None:
+            return self._not_found()
+        self._send(200, {"success": True, "data": user})
+
+    def do_POST(self):
+        matched, user_id = self._route()
+        if not matched or user_id is not None:
+            return self._not_found()
+        data = self._read_json()
+        if not isinstance(data, dict):
+            return self._send(400, {"success": False, "message": "Invalid JSON body"})
+        self._send(201, {"success": True, "data": self.server.store.create(data)})
+
+    def do_PUT(self):
+        matched, user_id = self._route()
+        if not matched or user_id is None:
+            return self._not_found()
+        data = self._read_json()
+        if not isinstance(data, dict):
+            return self._send(400, {"success": False, "message": "Invalid JSON body"})
+        user = self.server.store.update(user_id, data)
+        if user is None:
+            return self._not_found()
+        self._send(200, {"success": True, "data": user})
+
+    def do_DELETE(self):
+        matched, user_id = self._route()
+        if not matched or user_id is None:
+            return self._not_found()
+        user = self.server.store.delete(user_id)
+        if user is None:
+            return self._not_found()
+        self._send(200, {"success": True, "data": user})
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, store: UserStore, latency_ms: float, jitter_ms: float):
+        super().__init__(address, _UsersHandler)
+        self.store = store
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+
+    def apply_latency(self):
+        delay = self.latency_ms + (random.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+
+
+class MockAPIServer:
+    """
+    In-process HTTP server serving /api/users CRUD on local loopback.
+    Users come from an in-memory store, optionally seeded from a recorded cassette.
+    Usage:
+      server = MockAPIServer(latency_ms=20).start()
+      client = BaseAPIClient(server.base_url)
+      ...
+      server.stop()
+    """
+
+    def __init__(self, users: Optional[list] = None, host: str = "127.0.0.1", port: int = 0,
+                 latency_ms: float = 0, jitter_ms: float = 0):
+        self.store = UserStore(users)
+        self._httpd = _MockHTTPServer((host, port), self.store, latency_ms, jitter_ms)
+        self._thread = None
+
+    @classmethod
+    def from_cassette(cls, path, **kwargs):
+        """Seed users from the first recorded GET /api/users response in a cassette file"""
+        users = DEFAULT_USERS
+        path = Path(path)
+        if path.is_file():
+            with path.open("r") as f:
+                interactions = json.load(f).get("interactions", [])
+            for interaction in interactions:
+                req = interaction["request"]
+                if req["method"] == "GET" and req["url"].split("?", 1)[0].rstrip("/").endswith("/api/users"):
+                    body = json.loads(interaction["response"].get("body") or "null")
+                    data = body.get("data") if isinstance(body, dict) else body
+                    if isinstance(data, list):
+                        users = data
+                        break
+        return cls(users=users, **kwargs)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-api-server", daemon=True)
+            self._thread.start()
+            logger.info("Mock API server listening on %s", self.base_url)
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -10,6 +10,8 @@ class Config:
     REPORTS_DIR = BASE_DIR / 'reports'
     LOGS_DIR = BASE_DIR / 'logs'
     DATA_DIR = BASE_DIR / 'data'
+    CACHE_DIR = BASE_DIR / '.cache'
+    CASSETTES_DIR = DATA_DIR / 'cassettes'
 
     # Browser settings
     BROWSER = os.getenv('BROWSER', 'chrome')
@@ -23,6 +25,24 @@ class Config:
     # Screenshot settings
     SCREENSHOT_ON_FAILURE = True
 
+    # Parsed feature file cache (shared between workers, keyed by content hash)
+    FEATURE_CACHE = os.getenv('FEATURE_CACHE', 'true').lower() == 'true'
+
+    # API mode: live (remote service), mock (in-process server), record / replay (cassettes)
+    API_MODE = os.getenv('API_MODE', 'live').lower()
+    MOCK_LATENCY_MS = float(os.getenv('MOCK_LATENCY_MS', '0'))
+    MOCK_JITTER_MS = float(os.getenv('MOCK_JITTER_MS', '0'))
+
+    # Created-resource cleanup: scenario (after each scenario), batch (after_all) or off
+    CLEANUP_MODE = os.getenv('CLEANUP_MODE', 'scenario').lower()
+    CLEANUP_WORKERS = int(os.getenv('CLEANUP_WORKERS', '8'))
+
+    # Scenario scheduling: fail-fast tags, in-process retries and flaky quarantine
+    FAIL_FAST_TAGS = os.getenv('FAIL_FAST_TAGS', '')
+    RETRIES = int(os.getenv('RETRIES', '0'))
+    FLAKY_THRESHOLD = float(os.getenv('FLAKY_THRESHOLD', '0.1'))
+    QUARANTINE_THRESHOLD = float(os.getenv('QUARANTINE_THRESHOLD', '0'))
+
     # Environment
     ENV = os.getenv('ENV', 'dev')
 
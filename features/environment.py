@@ -1,7 +1,22 @@
 # File: `features/environment.py`
 import os
+import re
 import subprocess
 import shutil
+from pathlib import Path
+import requests
+from requests.adapters import HTTPAdapter
+from api.cassette import Cassette
+from api.cleanup_registry import CleanupRegistry
+from api.mock_server import MockAPIServer
+from config.config import Config
+from utilities.feature_cache import FeatureCache, ScenarioSharder
+from utilities.scenario_scheduler import ScenarioHistory, ScenarioScheduler
+
+API_MODES = ("live", "mock") + Cassette.MODES
+
+# Hooks are loaded before behave parses features, so patching here is enough
+FeatureCache.install()
 
 def before_all(context):
     # allow overrides via behave userdata (e.g. -D reports_dir=custom)
@@ -27,11 +42,96 @@ def before_all(context):
     os.makedirs(context.reports_dir, exist_ok=True)
     os.makedirs(os.path.dirname(context.html_report), exist_ok=True)
 
+    # Split tag-selected scenarios between parallel workers (-D worker_index=0 -D worker_count=4)
+    context.sharder = ScenarioSharder(
+        int(userdata.get("worker_index", os.environ.get("WORKER_INDEX", 0))),
+        int(userdata.get("worker_count", os.environ.get("WORKER_COUNT", 1))),
+    )
+
+    # Fail-fast, rerun-failed-only and adaptive retry/quarantine from recorded history
+    context.scheduler = ScenarioScheduler(
+        ScenarioHistory(),
+        fail_fast_tags=userdata.get("fail_fast", Config.FAIL_FAST_TAGS).split(","),
+        rerun_failed=str(userdata.get("rerun_failed", "")).lower() in ("1", "true", "yes"),
+        retries=int(userdata.get("retries", Config.RETRIES)),
+        flaky_threshold=float(userdata.get("flaky_threshold", Config.FLAKY_THRESHOLD)),
+        quarantine_threshold=float(userdata.get("quarantine_threshold", Config.QUARANTINE_THRESHOLD)),
+    )
+
+    # API mode: live | mock | record | replay (-D api_mode=mock or API_MODE=mock)
+    api_mode = userdata.get("api_mode", Config.API_MODE).lower()
+    if api_mode not in API_MODES:
+        raise ValueError(f"Unknown api_mode '{api_mode}', expected one of {API_MODES}")
+    context.api_mode = api_mode
+    context.mock_server = None
+    if context.api_mode == "mock":
+        seed = userdata.get("mock_seed_cassette", Config.CASSETTES_DIR / "user_api" / "get_list_of_users.json")
+        context.mock_server = MockAPIServer.from_cassette(
+            seed,
+            latency_ms=float(userdata.get("mock_latency_ms", Config.MOCK_LATENCY_MS)),
+            jitter_ms=float(userdata.get("mock_jitter_ms", Config.MOCK_JITTER_MS)),
+        ).start()
+        print(f"Mock API server: {context.mock_server.base_url}")
+
+    # Resources created by steps are deleted per scenario or in bulk at the end (-D cleanup=batch)
+    cleanup_mode = userdata.get("cleanup", Config.CLEANUP_MODE).lower()
+    if cleanup_mode not in CleanupRegistry.MODES:
+        raise ValueError(f"Unknown cleanup mode '{cleanup_mode}', expected one of {CleanupRegistry.MODES}")
+    context.cleanup_workers = int(userdata.get("cleanup_workers", Config.CLEANUP_WORKERS))
+    context.cleanup = CleanupRegistry()
+    context.cleanup_mode = cleanup_mode
+
+    # One pooled session for the whole run; size the pool so concurrent cleanup DELETEs keep their connections
+    context.api_session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=max(10, context.cleanup_workers))
+    context.api_session.mount("http://", adapter)
+    context.api_session.mount("https://", adapter)
+
     print(f"Reports directory: {context.reports_dir}")
     print(f"Expecting Allure results in: {context.allure_results}")
     print(f"Expecting Behave HTML at: {context.html_report}")
 
+def before_feature(context, feature):
+    context.scheduler.prepare_feature(feature)
+    tag_expression = getattr(context.config, "tag_expression", None) or getattr(context.config, "tags", None)
+    context.sharder.filter_feature(feature, tag_expression)
+
+def _cassette_path(scenario):
+    slug = re.sub(r"[^a-z0-9]+", "_", scenario.name.lower()).strip("_")
+    return Config.CASSETTES_DIR / Path(scenario.filename).stem / f"{slug}.json"
+
+def before_scenario(context, scenario):
+    quarantine_reason = context.scheduler.quarantine_reason(scenario)
+    if quarantine_reason:
+        scenario.skip(reason=quarantine_reason)
+        return
+    context.cassette = None
+    if context.api_mode in Cassette.MODES and "api" in scenario.effective_tags:
+        context.cassette = Cassette(_cassette_path(scenario), mode=context.api_mode)
+
+def after_scenario(context, scenario):
+    if context.scheduler.quarantine_reason(scenario):
+        return
+    # Clean up before saving so recorded cassettes include the teardown DELETEs
+    if context.cleanup_mode == "scenario":
+        # Failures stay queued so the after_all flush retries and reports them
+        context.cleanup.flush(requeue_failed=True)
+    if context.cassette is not None:
+        context.cassette.save()
+
 def after_all(context):
+    # before_all may have stopped early on a bad setting, so only tear down what exists
+    if getattr(context, "cleanup_mode", "off") != "off":
+        failed = context.cleanup.flush(max_workers=context.cleanup_workers)
+        if failed:
+            print(f"Cleanup failed for {len(failed)} resource(s): {', '.join(failed[:10])}")
+    if getattr(context, "api_session", None) is not None:
+        context.api_session.close()
+    if getattr(context, "mock_server", None) is not None:
+        context.mock_server.stop()
+    if getattr(context, "scheduler", None) is not None:
+        context.scheduler.save()
+
     print("\n" + "="*60)
     print("POST-RUN REPORT GENERATION")
     print("="*60)
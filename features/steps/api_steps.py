@@ -25,9 +25,25 @@ def _coerce_value(val: str):
     except Exception:
         return v
 
+def _register_created(context, path):
+    """Queue the resource created by a POST for deletion at teardown."""
+    cleanup = getattr(context, "cleanup", None)
+    data = context.response_json
+    if cleanup is None or not context.response.ok or not isinstance(data, dict):
+        return
+    created = data.get("data") if isinstance(data.get("data"), dict) else data
+    resource_id = created.get("_id") or created.get("id")
+    if resource_id is not None:
+        cleanup.register(context.client, f"{path.rstrip('/')}/{resource_id}", headers=context.auth_headers)
+
 @given('base api url is "{base_url}"')
 def step_set_base_url(context, base_url):
-    context.client = BaseAPIClient(base_url)
+    # In mock mode every API scenario targets the local in-process server
+    mock_server = getattr(context, "mock_server", None)
+    if mock_server is not None:
+        base_url = mock_server.base_url
+    context.client = BaseAPIClient(base_url, session=getattr(context, "api_session", None),
+                                   cassette=getattr(context, "cassette", None))
     context.auth_headers = {}
 
 @given('I have a valid authentication token')
@@ -80,6 +96,7 @@ def step_post_with_body(context, path):
         context.response_json = resp.json()
     except Exception:
         context.response_json = None
+    _register_created(context, path)
 
 @when('I send a PUT request to "{path}" with data:')
 def step_put_with_data(context, path):
@@ -104,6 +121,8 @@ def step_delete(context, path):
     
     resp = context.client.delete(path, headers=context.auth_headers)
     context.response = resp
+    if resp.ok and hasattr(context, "cleanup"):
+        context.cleanup.discard(path)
     context.response_json = None
     try:
         context.response_json = resp.json()
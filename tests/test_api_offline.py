@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from api.base_api_client import BaseAPIClient
+from api.cassette import Cassette, CassetteMissError
+from api.mock_server import DEFAULT_USERS, MockAPIServer
+
+
+@pytest.fixture
+def server():
+    with MockAPIServer(users=DEFAULT_USERS) as mock:
+        yield mock
+
+
+def test_mock_server_users_crud(server):
+    client = BaseAPIClient(server.base_url)
+
+    listed = client.get("/api/users")
+    assert listed.status_code == 200
+    assert len(listed.json()["data"]) == len(DEFAULT_USERS)
+
+    created = client.post("/api/users", json={"name": "Temp", "email": "temp@example.com"})
+    assert created.status_code == 201
+    user_id = created.json()["data"]["_id"]
+
+    updated = client.put(f"/api/users/{user_id}", json={"age": 40})
+    assert updated.json()["data"]["age"] == 40
+
+    assert client.delete(f"/api/users/{user_id}").status_code == 200
+    assert client.get(f"/api/users/{user_id}").status_code == 404
+
+
+def test_mock_server_rejects_invalid_body(server):
+    client = BaseAPIClient(server.base_url)
+    resp = client.post("/api/users", data="not json", headers={"Content-Type": "application/json"})
+    assert resp.status_code == 400
+
+
+def test_cassette_record_then_replay(server, tmp_path):
+    path = tmp_path / "users.json"
+    recorder = Cassette(path, mode="record")
+    client = BaseAPIClient(server.base_url, cassette=recorder)
+    client.get("/api/users")
+    created = client.post("/api/users", json={"name": "Recorded"})
+    recorder.save()
+
+    replayer = Cassette(path, mode="replay")
+    offline = BaseAPIClient(server.base_url, cassette=replayer)
+    server.stop()
+
+    listed = offline.get("/api/users")
+    replayed = offline.post("/api/users", json={"name": "Different body"})
+    assert listed.status_code == 200
+    assert len(listed.json()["data"]) == len(DEFAULT_USERS)
+    assert replayed.status_code == 201
+    assert replayed.json() == created.json()
+
+
+def test_cassette_replay_miss_raises(tmp_path):
+    path = tmp_path / "empty.json"
+    path.write_text(json.dumps({"interactions": []}))
+    client = BaseAPIClient("http://127.0.0.1:9", cassette=Cassette(path, mode="replay"))
+    with pytest.raises(CassetteMissError):
+        client.get("/api/users")
+
+
+def test_cassette_rejects_unknown_mode(tmp_path):
+    with pytest.raises(ValueError):
+        Cassette(tmp_path / "x.json", mode="replya")
+
+
+def test_mock_server_seeded_from_cassette(server, tmp_path):
+    path = tmp_path / "seed.json"
+    cassette = Cassette(path, mode="record")
+    client = BaseAPIClient(server.base_url, cassette=cassette)
+    client.post("/api/users", json={"name": "Seeded"})
+    client.get("/api/users")
+    cassette.save()
+
+    with MockAPIServer.from_cassette(path) as seeded:
+        names = [u["name"] for u in BaseAPIClient(seeded.base_url).get("/api/users").json()["data"]]
+    assert "Seeded" in names
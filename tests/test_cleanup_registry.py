@@ -0,0 +1,80 @@
+import socket
+
+import pytest
+
+from api.base_api_client import BaseAPIClient
+from api.cleanup_registry import CleanupRegistry
+from api.mock_server import MockAPIServer
+
+
+@pytest.fixture
+def server():
+    with MockAPIServer() as mock:
+        yield mock
+
+
+def _create_users(client, registry, count):
+    paths = []
+    for i in range(count):
+        user_id = client.post("/api/users", json={"name": f"User {i}"}).json()["data"]["_id"]
+        path = f"/api/users/{user_id}"
+        registry.register(client, path)
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_flush_deletes_registered_resources(server, max_workers):
+    client = BaseAPIClient(server.base_url)
+    registry = CleanupRegistry()
+    _create_users(client, registry, 6)
+
+    failed = registry.flush(max_workers=max_workers)
+
+    assert failed == []
+    assert len(registry) == 0
+    assert server.store.list() == []
+
+
+def test_discarded_resources_are_not_deleted_again(server):
+    client = BaseAPIClient(server.base_url)
+    registry = CleanupRegistry()
+    kept, deleted = _create_users(client, registry, 2)
+    client.delete(deleted)
+    registry.discard(deleted)
+
+    assert registry.flush() == []
+    assert server.store.list() == []
+    assert len(registry) == 0
+
+
+def test_already_deleted_resource_is_not_a_failure(server):
+    client = BaseAPIClient(server.base_url)
+    registry = CleanupRegistry()
+    (path,) = _create_users(client, registry, 1)
+    client.delete(path)
+
+    assert registry.flush() == []
+
+
+def test_unreachable_server_reports_failed_paths():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    registry = CleanupRegistry()
+    registry.register(BaseAPIClient(f"http://127.0.0.1:{port}"), "/api/users/1")
+
+    assert registry.flush() == ["/api/users/1"]
+
+
+def test_requeued_failures_are_retried_by_next_flush():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    registry = CleanupRegistry()
+    registry.register(BaseAPIClient(f"http://127.0.0.1:{port}"), "/api/users/1")
+
+    assert registry.flush(requeue_failed=True) == ["/api/users/1"]
+    assert len(registry) == 1
+    assert registry.flush() == ["/api/users/1"]
+    assert len(registry) == 0
@@ -0,0 +1,147 @@
+from behave import parser
+from behave.tag_expression import make_tag_expression
+
+from utilities.feature_cache import FeatureCache, ScenarioSharder
+
+FEATURE_TEXT = """\
+@users
+Feature: Users
+
+  @api @get
+  Scenario: List users
+    Given base api url is "http://localhost"
+
+  @api @post
+  Scenario: Create user
+    Given base api url is "http://localhost"
+
+  @ui
+  Scenario: Login page
+    Given I am on the login page
+
+  Rule: Deleting users
+
+    @api @delete
+    Scenario: Delete user
+      Given base api url is "http://localhost"
+
+    @api @delete
+    Scenario Outline: Delete missing user <id>
+      Given base api url is "http://localhost"
+
+      Examples:
+        | id |
+        | 1  |
+        | 2  |
+"""
+
+
+class CountingParser:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, filename, language=None):
+        self.calls += 1
+        return parser.parse_file(filename, language=language)
+
+
+def _write_feature(tmp_path, text=FEATURE_TEXT):
+    path = tmp_path / "users.feature"
+    path.write_text(text)
+    return str(path)
+
+
+def test_cache_round_trip_skips_parser_on_second_load(tmp_path, monkeypatch):
+    monkeypatch.setattr(FeatureCache, "CACHE_DIR", tmp_path / "cache")
+    filename = _write_feature(tmp_path)
+    parse = CountingParser()
+
+    first = FeatureCache.parse_file(filename, _parse=parse)
+    second = FeatureCache.parse_file(filename, _parse=parse)
+
+    assert parse.calls == 1
+    assert second is not first
+    assert [s.name for s in second.walk_scenarios()] == [s.name for s in first.walk_scenarios()]
+    assert second.tags == ["users"]
+    assert second.tags[0].line == first.tags[0].line
+    assert second.run_items[0].effective_tags == {"users", "api", "get"}
+
+
+def test_cache_invalidated_when_file_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(FeatureCache, "CACHE_DIR", tmp_path / "cache")
+    filename = _write_feature(tmp_path)
+    parse = CountingParser()
+
+    FeatureCache.parse_file(filename, _parse=parse)
+    _write_feature(tmp_path, FEATURE_TEXT.replace("List users", "List all users"))
+    feature = FeatureCache.parse_file(filename, _parse=parse)
+
+    assert parse.calls == 2
+    assert feature.run_items[0].name == "List all users"
+
+
+def test_parse_file_defaults_to_behave_parser(tmp_path, monkeypatch):
+    monkeypatch.setattr(FeatureCache, "CACHE_DIR", tmp_path / "cache")
+    filename = _write_feature(tmp_path)
+
+    assert FeatureCache.parse_file(filename).name == "Users"
+    assert FeatureCache.parse_file(filename).name == "Users"
+
+
+def test_corrupt_entry_is_reparsed(tmp_path, monkeypatch):
+    monkeypatch.setattr(FeatureCache, "CACHE_DIR", tmp_path / "cache")
+    filename = _write_feature(tmp_path)
+    parse = CountingParser()
+    FeatureCache.parse_file(filename, _parse=parse)
+    for entry in FeatureCache.CACHE_DIR.iterdir():
+        entry.write_bytes(b"not a pickle")
+
+    feature = FeatureCache.parse_file(filename, _parse=parse)
+
+    assert parse.calls == 2
+    assert feature.name == "Users"
+
+
+def _run_shard(filename, worker_index, worker_count, tags="@api"):
+    feature = parser.parse_file(filename)
+    tag_expression = make_tag_expression(tags)
+    ScenarioSharder(worker_index, worker_count).filter_feature(feature, tag_expression)
+    # Same selection behave makes: not skipped and matching --tags
+    return {s.name for s in ScenarioSharder.iter_scenarios(feature)
+            if not s.should_skip and s.should_run_with_tags(tag_expression)}
+
+
+def test_shards_do_not_overlap_and_cover_tagged_scenarios(tmp_path):
+    filename = _write_feature(tmp_path)
+
+    shard_0 = _run_shard(filename, 0, 2)
+    shard_1 = _run_shard(filename, 1, 2)
+
+    assert shard_0 and shard_1
+    assert shard_0.isdisjoint(shard_1)
+    # The @ui scenario is excluded by tags, not by sharding
+    assert shard_0 | shard_1 == {
+        "List users", "Create user", "Delete user", "Delete missing user <id>",
+    }
+
+
+def test_single_worker_runs_everything(tmp_path):
+    filename = _write_feature(tmp_path)
+    feature = parser.parse_file(filename)
+
+    ScenarioSharder().filter_feature(feature, make_tag_expression("@api"))
+
+    assert not any(s.should_skip for s in ScenarioSharder.iter_scenarios(feature))
+
+
+def test_already_skipped_scenarios_do_not_take_a_shard_slot(tmp_path):
+    filename = _write_feature(tmp_path)
+    feature = parser.parse_file(filename)
+    tag_expression = make_tag_expression("@api")
+    feature.run_items[0].mark_skipped()
+
+    ScenarioSharder(0, 2).filter_feature(feature, tag_expression)
+
+    running = [s.name for s in ScenarioSharder.iter_scenarios(feature)
+               if not s.should_skip and s.should_run_with_tags(tag_expression)]
+    assert running == ["Create user", "Delete missing user <id>"]
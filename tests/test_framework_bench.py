@@ -0,0 +1,70 @@
+from benchmarks import framework_bench
+from benchmarks.framework_bench import compare, measure
+
+
+def _report(**timings):
+    return {"results": {name: {"median_s": t, "min_s": t} for name, t in timings.items()}}
+
+
+def test_measure_reports_median_fastest_round_and_spread():
+    result = measure(lambda: None, iterations=100, repeat=3)
+    assert 0 < result["min_s"] <= result["median_s"]
+    assert result["spread"] >= 0
+
+
+def test_identical_reports_do_not_regress():
+    report = _report(a=1e-3, b=2e-7)
+    assert compare(report, report, threshold=0.25) == []
+
+
+def test_sub_microsecond_noise_is_ignored():
+    baseline = _report(**{"config.attribute": 1.0e-7})
+    current = _report(**{"config.attribute": 1.3e-7})
+    assert compare(current, baseline, threshold=0.25) == []
+
+
+def test_regression_above_threshold_and_floor_fails():
+    baseline = _report(slow=1e-3, fine=1e-3)
+    current = _report(slow=2e-3, fine=1.1e-3)
+    assert compare(current, baseline, threshold=0.25) == ["slow"]
+
+
+def test_ungated_metrics_are_reported_but_never_fail():
+    baseline = _report(loopback=1e-5)
+    current = {"results": {"loopback": {"median_s": 1e-3, "min_s": 1e-3, "gated": False}}}
+    assert compare(current, baseline, threshold=0.25) == []
+
+
+def test_noisy_benchmark_gets_wider_tolerance():
+    baseline = _report(noisy=1e-3)
+    baseline["results"]["noisy"]["spread"] = 0.4
+    current = _report(noisy=1.5e-3)
+    assert compare(current, baseline, threshold=0.25) == []
+    current = _report(noisy=1.7e-3)
+    assert compare(current, baseline, threshold=0.25) == ["noisy"]
+
+
+def test_machine_slowdown_is_factored_out():
+    baseline = _report(work=1e-3)
+    baseline["results"]["work"]["ref_s"] = 1e-5
+    current = _report(work=1.5e-3)
+    current["results"]["work"]["ref_s"] = 1.5e-5
+    assert compare(current, baseline, threshold=0.25) == []
+    current["results"]["work"]["ref_s"] = 1e-5
+    assert compare(current, baseline, threshold=0.25) == ["work"]
+
+
+def test_interleaved_runs_keep_fastest_relative_pass(monkeypatch):
+    timings = iter([(3e-3, 1e-5), (1.5e-3, 1e-5), (1e-3, 0.5e-5)])
+
+    def fake_bench(results, scale):
+        t, ref = next(timings)
+        results["fake"] = {"median_s": t, "min_s": t, "spread": t * 100, "ref_s": ref, "ops_per_sec": 1 / t}
+
+    monkeypatch.setitem(framework_bench.BENCHMARKS, "fake", fake_bench)
+    result = framework_bench.run(["fake"], runs=3)["results"]["fake"]
+    # Second pass is fastest relative to the machine speed measured alongside it
+    assert result["min_s"] == 1.5e-3
+    assert result["median_s"] == 1.5e-3
+    assert result["spread"] == 0.3
+    assert result["runs"] == 3
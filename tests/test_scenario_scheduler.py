@@ -0,0 +1,179 @@
+from types import SimpleNamespace
+
+import pytest
+from behave import parser
+from behave.model import Status
+
+from utilities.scenario_scheduler import (
+    FAILED, PASSED, QUARANTINED, RETRIED, ScenarioHistory, ScenarioScheduler,
+)
+
+FEATURE_TEXT = """\
+Feature: Users
+
+  @api
+  Scenario: List users
+    Given base api url is "http://localhost"
+
+  @api @smoke
+  Scenario: Create user
+    Given base api url is "http://localhost"
+
+  @api @flaky
+  Scenario: Delete user
+    Given base api url is "http://localhost"
+"""
+
+
+@pytest.fixture
+def feature(tmp_path):
+    path = tmp_path / "users.feature"
+    path.write_text(FEATURE_TEXT)
+    return parser.parse_file(str(path))
+
+
+def _history(tmp_path, outcomes_by_key):
+    history = ScenarioHistory(tmp_path / "history.json")
+    for key, outcomes in outcomes_by_key.items():
+        history.scenarios[key] = {"outcomes": list(outcomes)}
+    return history
+
+
+def _key(feature, name):
+    return f"{feature.filename}::{name}"
+
+
+def _stub_runs(scenario, results):
+    """Replace scenario.run with canned results (True = failed) before the scheduler wraps it"""
+    remaining = list(results)
+
+    def run(runner):
+        failed = remaining.pop(0)
+        scenario.set_status(Status.failed if failed else Status.passed)
+        return failed
+
+    scenario.run = run
+
+
+@pytest.mark.parametrize("outcomes, expected", [
+    ([], 0.0),
+    ([PASSED] * 10, 0.0),
+    ([FAILED] * 10, 0.0),
+    ([RETRIED, FAILED, RETRIED], 1.0),
+    ([PASSED, FAILED, PASSED, FAILED], 0.75),
+    ([PASSED, PASSED, RETRIED, PASSED], 0.25),
+    ([PASSED, QUARANTINED, QUARANTINED, PASSED], 0.0),
+])
+def test_flakiness(tmp_path, outcomes, expected):
+    history = _history(tmp_path, {"f::s": outcomes})
+    rate = history.flakiness("f::s")
+    assert rate == pytest.approx(expected)
+    assert 0.0 <= rate <= 1.0
+
+
+def test_history_save_merges_and_trims_window(tmp_path):
+    path = tmp_path / "history.json"
+    ScenarioHistory(path, window=3).save({"f::a": PASSED})
+    for outcome in (FAILED, RETRIED, PASSED):
+        ScenarioHistory(path, window=3).save({"f::a": outcome, "f::b": FAILED})
+
+    history = ScenarioHistory(path)
+    assert history.outcomes("f::a") == [FAILED, RETRIED, PASSED]
+    assert history.outcomes("f::b") == [FAILED, FAILED, FAILED]
+
+
+def test_rerun_failed_runs_only_last_failed_scenario(tmp_path, feature):
+    history = _history(tmp_path, {
+        _key(feature, "List users"): [FAILED, PASSED],
+        _key(feature, "Create user"): [PASSED, FAILED],
+        _key(feature, "Delete user"): [PASSED],
+    })
+    ScenarioScheduler(history, rerun_failed=True).prepare_feature(feature)
+
+    running = [s.name for s in feature.run_items if s.should_run()]
+    assert running == ["Create user"]
+
+
+def test_without_rerun_failed_everything_runs(tmp_path, feature):
+    ScenarioScheduler(_history(tmp_path, {})).prepare_feature(feature)
+    assert all(s.should_run() for s in feature.run_items)
+
+
+def test_retries_only_flaky_scenarios(tmp_path, feature):
+    history = _history(tmp_path, {_key(feature, "List users"): [PASSED, FAILED, PASSED]})
+    scheduler = ScenarioScheduler(history, retries=2, flaky_threshold=0.5)
+    list_users, create_user, delete_user = feature.run_items
+
+    assert scheduler.max_attempts(list_users) == 3    # history says flaky
+    assert scheduler.max_attempts(create_user) == 1   # always passed
+    assert scheduler.max_attempts(delete_user) == 3   # tagged @flaky
+
+
+def test_retried_pass_is_recorded(tmp_path, feature):
+    scheduler = ScenarioScheduler(_history(tmp_path, {}), retries=2)
+    delete_user = feature.run_items[2]
+    _stub_runs(delete_user, [True, False])
+    scheduler.prepare_feature(feature)
+
+    assert delete_user.run(SimpleNamespace(aborted=False)) is False
+    assert scheduler.results[_key(feature, "Delete user")] == RETRIED
+
+
+def test_fail_fast_aborts_runner_for_tagged_scenario(tmp_path, feature):
+    scheduler = ScenarioScheduler(_history(tmp_path, {}), fail_fast_tags=["@smoke"])
+    list_users, create_user, _ = feature.run_items
+    _stub_runs(list_users, [True])
+    _stub_runs(create_user, [True])
+    scheduler.prepare_feature(feature)
+    runner = SimpleNamespace(aborted=False)
+
+    list_users.run(runner)
+    assert runner.aborted is False
+    create_user.run(runner)
+    assert runner.aborted is True
+
+
+def test_quarantine_after_min_runs_then_probation(tmp_path, feature):
+    flaky = [PASSED, FAILED] * 3
+    key = _key(feature, "List users")
+
+    scheduler = ScenarioScheduler(_history(tmp_path, {key: flaky}), quarantine_threshold=0.5)
+    scheduler.prepare_feature(feature)
+    assert scheduler.quarantine_reason(feature.run_items[0])
+    assert not scheduler.quarantine_reason(feature.run_items[1])
+
+    # Too little history: not quarantined yet
+    scheduler = ScenarioScheduler(_history(tmp_path, {key: flaky[:3]}), quarantine_threshold=0.5)
+    scheduler.prepare_feature(feature)
+    assert not scheduler.quarantine_reason(feature.run_items[0])
+
+    # After quarantine_runs skipped runs it gets a probation run
+    scheduler = ScenarioScheduler(_history(tmp_path, {key: flaky + [QUARANTINED] * 5}),
+                                  quarantine_threshold=0.5)
+    scheduler.prepare_feature(feature)
+    assert not scheduler.quarantine_reason(feature.run_items[0])
+
+
+def test_formatters_only_see_final_attempt(tmp_path, feature):
+    scheduler = ScenarioScheduler(_history(tmp_path, {}), retries=2)
+    delete_user = feature.run_items[2]
+    outcomes = [True, False]
+
+    def run(runner):
+        failed = outcomes.pop(0)
+        for formatter in runner.formatters:
+            formatter.scenario(delete_user)
+            formatter.result("failed" if failed else "passed")
+        delete_user.set_status(Status.failed if failed else Status.passed)
+        return failed
+
+    delete_user.run = run
+    scheduler.prepare_feature(feature)
+    calls = []
+    formatter = SimpleNamespace(scenario=lambda s: calls.append(("scenario", s.name)),
+                                result=lambda r: calls.append(("result", r)))
+    runner = SimpleNamespace(aborted=False, formatters=[formatter])
+
+    assert delete_user.run(runner) is False
+    assert calls == [("scenario", "Delete user"), ("result", "passed")]
+    assert runner.formatters == [formatter]
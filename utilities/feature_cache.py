@@ -0,0 +1,163 @@
+import copyreg
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+import zlib
+from pathlib import Path
+
+import behave
+from behave import parser as behave_parser
+from behave.model import Tag
+
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+def _pickle_tag(tag):
+    return type(tag), (str(tag), tag.line)
+
+
+# behave's Tag is a str subclass whose __new__ also needs the line number
+copyreg.pickle(Tag, _pickle_tag)
+
+# Captured before FeatureCache.install() patches behave's parser
+_behave_parse_file = behave_parser.parse_file
+
+
+class FeatureCache:
+    """
+    On-disk cache of parsed .feature files keyed by file content hash.
+    Entries are shared between parallel workers and reused across runs;
+    editing a feature file changes its hash, so stale entries are never hit.
+    Usage:
+      FeatureCache.install()   # from features/environment.py
+    """
+    CACHE_DIR = Config.CACHE_DIR / 'features'
+
+    _installed = False
+
+    @classmethod
+    def cache_key(cls, content, language=None):
+        """Build cache key from file content, parser language and runtime versions"""
+        digest = hashlib.sha256(content)
+        digest.update(f"|{language or ''}|{behave.__version__}|{sys.version_info[:2]}".encode())
+        return digest.hexdigest()
+
+    @classmethod
+    def load(cls, key):
+        """Return cached feature for key, or None on miss/corrupt entry"""
+        path = cls.CACHE_DIR / f'{key}.pickle'
+        try:
+            with path.open('rb') as f:
+                return pickle.loads(zlib.decompress(f.read()))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Corrupt or incompatible entry - drop it and re-parse
+            logger.warning("Dropping unreadable feature cache entry %s: %s", path.name, e)
+            path.unlink(missing_ok=True)
+            return None
+
+    @classmethod
+    def store(cls, key, feature):
+        """Write cache entry atomically so concurrent workers never read partial files"""
+        try:
+            payload = zlib.compress(pickle.dumps(feature, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception as e:
+            logger.warning("Cannot cache parsed feature %s: %s", getattr(feature, "filename", key), e)
+            return False
+        cls.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cls.CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, cls.CACHE_DIR / f'{key}.pickle')
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            return False
+        return True
+
+    @classmethod
+    def parse_file(cls, filename, language=None, _parse=None):
+        """Drop-in replacement for behave.parser.parse_file backed by the cache"""
+        _parse = _parse or _behave_parse_file
+        with open(filename, 'rb') as f:
+            content = f.read()
+        key = cls.cache_key(content, language)
+        feature = cls.load(key)
+        if feature is None:
+            feature = _parse(filename, language=language)
+            if feature is not None:
+                cls.store(key, feature)
+        elif os.path.abspath(feature.filename) != os.path.abspath(filename):
+            # Same content under a different path (copied feature) - parse fresh
+            feature = _parse(filename, language=language)
+        return feature
+
+    @classmethod
+    def install(cls):
+        """Patch behave's parser so the runner loads features through the cache"""
+        if cls._installed or not Config.FEATURE_CACHE:
+            return
+
+        def cached_parse_file(filename, language=None):
+            return cls.parse_file(filename, language=language)
+
+        behave_parser.parse_file = cached_parse_file
+        cls._installed = True
+
+    @classmethod
+    def clear(cls):
+        """Remove all cached entries"""
+        if cls.CACHE_DIR.is_dir():
+            for entry in cls.CACHE_DIR.iterdir():
+                entry.unlink(missing_ok=True)
+
+
+class ScenarioSharder:
+    """
+    Splits tag-selected scenarios between parallel workers.
+    Every worker walks features in the same order, so the round-robin
+    assignment is identical everywhere and each scenario runs exactly once.
+    Usage:
+      behave --tags=@api -D worker_index=0 -D worker_count=4
+    """
+
+    def __init__(self, worker_index=0, worker_count=1):
+        if worker_count < 1 or not 0 <= worker_index < worker_count:
+            raise ValueError(f"Invalid shard {worker_index}/{worker_count}")
+        self.worker_index = worker_index
+        self.worker_count = worker_count
+        self._counter = 0
+
+    @property
+    def enabled(self):
+        return self.worker_count > 1
+
+    @classmethod
+    def iter_scenarios(cls, container):
+        """Yield scenarios and scenario outlines in run order, descending into Rules"""
+        for run_item in container.run_items:
+            if hasattr(run_item, "run_items"):
+                yield from cls.iter_scenarios(run_item)
+            else:
+                yield run_item
+
+    def filter_feature(self, feature, tag_expression=None):
+        """Mark scenarios assigned to other workers as skipped"""
+        if not self.enabled:
+            return feature
+        for scenario in self.iter_scenarios(feature):
+            if scenario.should_skip:
+                # Already excluded (e.g. rerun-failed), keep shards balanced over what actually runs
+                continue
+            if tag_expression is not None and not scenario.should_run_with_tags(tag_expression):
+                continue
+            if self._counter % self.worker_count != self.worker_index:
+                scenario.mark_skipped()
+            self._counter += 1
+        return feature
@@ -0,0 +1,223 @@
+import functools
+import json
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from config.config import Config
+from utilities.feature_cache import ScenarioSharder
+
+PASSED = "P"
+FAILED = "F"
+RETRIED = "R"  # passed only after a retry
+QUARANTINED = "Q"
+
+
+class _FormatterRecorder:
+    """
+    Stands in for runner.formatters during one scenario attempt and records every call,
+    so only the final attempt of a retried scenario reaches the reports.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+        return record
+
+    def replay(self, formatters):
+        for name, args, kwargs in self.calls:
+            for formatter in formatters:
+                # Same rule as behave's context.attach(): skip formatters without the hook
+                method = getattr(formatter, name, None)
+                if method is not None:
+                    method(*args, **kwargs)
+
+
+class ScenarioHistory:
+    """
+    Per-scenario outcome history stored as JSON between runs.
+    Each scenario keeps its most recent outcomes (P, F, R, Q), newest last.
+    """
+    HISTORY_FILE = Config.CACHE_DIR / 'scenario_history.json'
+
+    def __init__(self, path=None, window=20):
+        self.path = Path(path or self.HISTORY_FILE)
+        self.window = window
+        self.scenarios = self._read()
+
+    def _read(self):
+        try:
+            with self.path.open('r') as f:
+                return json.load(f).get("scenarios", {})
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def outcomes(self, key):
+        return self.scenarios.get(key, {}).get("outcomes", [])
+
+    def last_outcome(self, key):
+        outcomes = self.outcomes(key)
+        return outcomes[-1] if outcomes else None
+
+    def flakiness(self, key):
+        """Share of recent runs that passed only on retry or flipped pass/fail versus the previous run"""
+        outcomes = [o for o in self.outcomes(key) if o != QUARANTINED]
+        if not outcomes:
+            return 0.0
+        flaky_runs = 0
+        for index, outcome in enumerate(outcomes):
+            flipped = index > 0 and (outcome == FAILED) != (outcomes[index - 1] == FAILED)
+            if outcome == RETRIED or flipped:
+                flaky_runs += 1
+        return flaky_runs / len(outcomes)
+
+    def run_count(self, key):
+        return len([o for o in self.outcomes(key) if o != QUARANTINED])
+
+    def quarantined_streak(self, key):
+        streak = 0
+        for outcome in reversed(self.outcomes(key)):
+            if outcome != QUARANTINED:
+                break
+            streak += 1
+        return streak
+
+    def save(self, results):
+        """Merge this run's results into the file (re-read first so parallel workers don't clobber each other)"""
+        merged = self._read()
+        for key, outcome in results.items():
+            entry = merged.setdefault(key, {"outcomes": []})
+            entry["outcomes"] = (entry["outcomes"] + [outcome])[-self.window:]
+            entry["updated"] = datetime.now().isoformat(timespec="seconds")
+        self.scenarios = merged
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump({"scenarios": merged}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+class ScenarioScheduler:
+    """
+    Decides which scenarios run, how often they are retried and when the run stops.
+    - fail_fast_tags: abort the remaining run when a scenario with one of these tags fails
+    - rerun_failed: only run scenarios whose last recorded outcome was a failure
+    - retries: extra in-process attempts for scenarios tagged @flaky or with
+      flakiness >= flaky_threshold; retries reuse the pooled API session and
+      mock server set up in before_all, and formatters only see the final attempt
+    - quarantine_threshold: skip scenarios at least this flaky (after min_runs runs)
+      for quarantine_runs runs, then let them run again to collect fresh history
+    Usage:
+      behave -D fail_fast=smoke -D rerun_failed=true -D retries=2
+    """
+
+    def __init__(self, history, fail_fast_tags=(), rerun_failed=False, retries=0,
+                 flaky_threshold=0.1, quarantine_threshold=0.0, min_runs=5, quarantine_runs=5):
+        self.history = history
+        self.fail_fast_tags = {tag.lstrip('@') for tag in fail_fast_tags if tag}
+        self.rerun_failed = rerun_failed
+        self.retries = retries
+        self.flaky_threshold = flaky_threshold
+        self.quarantine_threshold = quarantine_threshold
+        self.min_runs = min_runs
+        self.quarantine_runs = quarantine_runs
+        self.results = {}
+        self._quarantined = {}
+
+    @staticmethod
+    def scenario_key(scenario):
+        return f"{scenario.filename}::{scenario.name}"
+
+    @staticmethod
+    def _expand(scenario):
+        """Scenario outlines run as their generated example scenarios"""
+        return list(getattr(scenario, "scenarios", None) or [scenario])
+
+    def _last_failed(self, scenario):
+        return any(self.history.last_outcome(self.scenario_key(s)) == FAILED for s in self._expand(scenario))
+
+    def quarantine_reason(self, scenario):
+        return self._quarantined.get(self.scenario_key(scenario))
+
+    def max_attempts(self, scenario):
+        if self.retries <= 0:
+            return 1
+        key = self.scenario_key(scenario)
+        if "flaky" in scenario.effective_tags or self.history.flakiness(key) >= self.flaky_threshold > 0:
+            return 1 + self.retries
+        return 1
+
+    def _check_quarantine(self, scenario):
+        if self.quarantine_threshold <= 0:
+            return
+        key = self.scenario_key(scenario)
+        if self.history.run_count(key) < self.min_runs:
+            return
+        if self.history.quarantined_streak(key) >= self.quarantine_runs:
+            # Probation run: collect fresh results before deciding again
+            return
+        rate = self.history.flakiness(key)
+        if rate >= self.quarantine_threshold:
+            self._quarantined[key] = f"Quarantined: flakiness {rate:.0%} over last {self.history.run_count(key)} runs"
+
+    def prepare_feature(self, feature):
+        """Skip non-failed scenarios on reruns and attach retry/quarantine handling, in place"""
+        for scenario in ScenarioSharder.iter_scenarios(feature):
+            if self.rerun_failed and not self._last_failed(scenario):
+                scenario.mark_skipped()
+                continue
+            for run_item in self._expand(scenario):
+                self._check_quarantine(run_item)
+                self._patch_run(run_item)
+        return feature
+
+    def _patch_run(self, scenario):
+        scenario_run = scenario.run
+
+        @functools.wraps(scenario_run)
+        def run_with_schedule(runner):
+            attempts = self.max_attempts(scenario)
+            formatters = getattr(runner, "formatters", None)
+            for attempt in range(1, attempts + 1):
+                recorder = None
+                if attempts > 1 and formatters:
+                    recorder = _FormatterRecorder()
+                    runner.formatters = [recorder]
+                try:
+                    failed = scenario_run(runner)
+                finally:
+                    if recorder is not None:
+                        runner.formatters = formatters
+                if not failed or attempt == attempts:
+                    if recorder is not None:
+                        recorder.replay(formatters)
+                    break
+                print(f"RETRY SCENARIO (attempt {attempt + 1}/{attempts}): {scenario.name}")
+            self._record(scenario, failed, attempt)
+            if failed and self.fail_fast_tags & set(scenario.effective_tags):
+                print(f"FAIL-FAST: aborting run after '{scenario.name}' failed")
+                if hasattr(runner, "abort"):
+                    runner.abort(reason="fail-fast")
+                else:
+                    runner.aborted = True
+            return failed
+
+        scenario.run = run_with_schedule
+
+    def _record(self, scenario, failed, attempt):
+        key = self.scenario_key(scenario)
+        status = getattr(scenario.status, "name", str(scenario.status))
+        if key in self._quarantined:
+            self.results[key] = QUARANTINED
+        elif failed:
+            self.results[key] = FAILED
+        elif status == "passed":
+            self.results[key] = RETRIED if attempt > 1 else PASSED
+
+    def save(self):
+        if self.results:
+            self.history.save(self.results)